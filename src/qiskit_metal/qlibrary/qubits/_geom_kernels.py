@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Numeric kernels for the rounded transmon pocket geometry.
+
+The vertices of a rounded rectangle are only a few dozen points, so the cost
+of building them is dominated by interpreter overhead rather than by the math
+itself. These kernels work on whole float64 arrays at once with numpy;
+shapely geometries are only built by the callers, at the boundary.
+"""
+
+import numpy as np
+
+
+def rounded_rect_coords(xmin, ymin, xmax, ymax, r, arc_cos, arc_sin):
+    """
+    Vertices of a rectangle with its four corners rounded by radius `r`.
+
+    Args:
+        xmin, ymin, xmax, ymax (float): Bounds of the rectangle.
+        r (float): Corner radius, assumed in (0, min(width, height)/2].
+        arc_cos, arc_sin (np.ndarray): cos and sin of the quarter-circle
+            sample angles, from 0 to pi/2 inclusive (see unit_arc).
+
+    Returns:
+        np.ndarray: (4*len(arc_cos), 2) C-contiguous float64 vertices,
+        counter-clockwise from the bottom edge. The ring is left open
+        (shapely closes it).
+    """
+    c = r * arc_cos
+    s = r * arc_sin
+    return np.concatenate([
+        # bottom-right, top-right, top-left, bottom-left corner arcs
+        np.column_stack((xmax - r + s, ymin + r - c)),
+        np.column_stack((xmax - r + c, ymax - r + s)),
+        np.column_stack((xmin + r - s, ymax - r + c)),
+        np.column_stack((xmin + r - c, ymin + r - s)),
+    ])
+
+
+def unit_arc(quad_segs):
+    """
+    Sample a unit quarter circle.
+
+    Args:
+        quad_segs (int): Number of segments in the quarter circle.
+
+    Returns:
+        tuple: (cos, sin) arrays of the quad_segs+1 angles from 0 to pi/2.
+    """
+    theta = np.linspace(0, np.pi / 2, quad_segs + 1)
+    return np.cos(theta), np.sin(theta)
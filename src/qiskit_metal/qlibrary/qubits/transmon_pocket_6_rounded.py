@@ -7,67 +7,174 @@ Adds rounded corners to rectangular polygons (pads, pocket, connector pads).
 
 How rounding works:
 - If corner_radius == 0 -> identical geometry to the stock component
-- If corner_radius > 0 -> rectangles are converted to rounded polygons via
-  erosion+dilation buffering (keeps outer dimensions approximately unchanged)
+- If corner_radius > 0 -> rectangles are built directly as rounded polygons
+  (4 straight edges + 4 sampled quarter-circle arcs), keeping the outer
+  dimensions unchanged
 """
 
+from copy import deepcopy
+from datetime import datetime
+from functools import lru_cache
+
 import numpy as np
-from shapely.geometry import box as _box
+import shapely
+from shapely.geometry import box as _box, LineString, MultiPolygon, Polygon
 from qiskit_metal import draw, Dict
 from qiskit_metal.qlibrary.core import BaseQubit
+from qiskit_metal.qlibrary.qubits._geom_kernels import rounded_rect_coords, unit_arc
+
+# _rounded_rectangle parameters are rounded to this many decimals (design
+# units) before the cache lookup
+_CACHE_DIGITS = 12
+
+# Default corner resolution (same as shapely's buffer) and its unit
+# quarter-circle, sampled once at import and scaled by the radius per call
+_QUAD_SEGS = 16
+_UNIT_ARC_COS, _UNIT_ARC_SIN = unit_arc(_QUAD_SEGS)
 
 
-def _rounded_rectangle(width, height, xoff=0.0, yoff=0.0, radius=0.0):
+def _rounded_rectangle(width, height, xoff=0.0, yoff=0.0, radius=0.0, quad_segs=_QUAD_SEGS,
+                       simplify_tol=0.0):
     """
     Return a shapely Polygon rectangle with optional rounded corners.
 
-    Parameters
-    ----------
-    width, height : float
-        Rectangle size in design units (already parsed).
-    xoff, yoff : float
-        Offset used like draw.rectangle(width, height, xoff, yoff).
-        In Metal's draw.rectangle, xoff/yoff define the *upper-left* reference
-        in some components; in practice, the stock code uses:
-          - draw.rectangle(w,h) centered at origin
-          - draw.rectangle(w,h, -w/2, h/2) to shift
-          - draw.rectangle(w,h, 0, h/2) etc.
-        Here we implement a faithful equivalent using shapely "box" built from
-        those same offsets.
-    radius : float
-        Corner radius. Clamped to [0, min(width,height)/2].
-
-    Notes
-    -----
-    We create the rectangle as a box, then apply:
+    The rectangle is placed like draw.rectangle(width, height, xoff, yoff)
+    in the stock components: (xoff, yoff) is its upper-left corner, so
+    (-w/2, h/2) centers it at the origin. With radius > 0 the outline is
+    built directly as four straight edges joined by quarter-circle arcs of
+    quad_segs segments each. On non-degenerate inputs this is the same
+    polygon as the erosion+dilation
         rect.buffer(-r, join_style=2).buffer(r, join_style=1)
-    This rounds the corners while keeping the *outer* size ~constant.
+    without its two GEOS offset passes. When the radius is clamped to half
+    the shorter side, the result is a stadium (or a disc for a square),
+    where the buffer chain collapsed to an empty polygon.
+
+    Shapes are memoized on their (quantized) parameters, since several pads
+    of a component typically share the same size and radius. The returned
+    geometry is shared and must not be mutated; shapely geometries are
+    immutable and draw.translate/scale/rotate always build new ones.
+
+    Args:
+        width (float): Rectangle width, in design units (already parsed).
+        height (float): Rectangle height, in design units (already parsed).
+        xoff (float): x of the left edge.  Defaults to 0.0.
+        yoff (float): y of the top edge.  Defaults to 0.0.
+        radius (float): Corner radius, clamped to [0, min(width, height)/2].
+            Defaults to 0.0.
+        quad_segs (int): Number of segments per quarter-circle corner.
+            Defaults to 16, the resolution shapely uses for buffer().
+        simplify_tol (float): If > 0, the rounded outline is simplified
+            (Douglas-Peucker) with this tolerance, dropping arc vertices not
+            needed at that resolution.  Defaults to 0.0.
+
+    Returns:
+        Polygon: The (rounded) rectangle.
     """
-    w = float(width)
-    h = float(height)
-    r = float(radius)
+    return _rounded_rectangle_cached(
+        round(float(width), _CACHE_DIGITS), round(float(height), _CACHE_DIGITS),
+        round(float(xoff), _CACHE_DIGITS), round(float(yoff), _CACHE_DIGITS),
+        round(float(radius), _CACHE_DIGITS), int(quad_segs),
+        round(float(simplify_tol), _CACHE_DIGITS)
+    )
+
 
+@lru_cache(maxsize=64)
+def _rounded_rectangle_cached(w, h, xoff, yoff, r, quad_segs, simplify_tol):
+    """Build the polygon for _rounded_rectangle (memoized)."""
     if r <= 0:
-        # Equivalent to draw.rectangle(w, h, xoff, yoff)
-        xmin = float(xoff)
+        # Equivalent to draw.rectangle(w, h, xoff, yoff). The bounds are
+        # ordered by construction, so skip box() and give the ring directly
+        # (same counter-clockwise vertex order as box). A float64 ndarray is
+        # read by shapely in one go, a tuple of tuples point by point.
+        xmin = xoff
         xmax = xmin + w
-        ymax = float(yoff)
+        ymax = yoff
         ymin = ymax - h
-        return _box(xmin, ymin, xmax, ymax)
+        return Polygon(np.array(((xmax, ymin), (xmax, ymax), (xmin, ymax), (xmin, ymin))))
 
     r = min(r, 0.5 * min(w, h))
 
-    xmin = float(xoff)
+    xmin = xoff
     xmax = xmin + w
-    ymax = float(yoff)
+    ymax = yoff
     ymin = ymax - h
-    rect = _box(xmin, ymin, xmax, ymax)
 
-    # Erode then dilate to round without changing outer bbox too much
-    rounded = rect.buffer(-r, join_style=2).buffer(r, join_style=1)
+    if quad_segs == _QUAD_SEGS:
+        arc_cos, arc_sin = _UNIT_ARC_COS, _UNIT_ARC_SIN
+    else:
+        arc_cos, arc_sin = unit_arc(quad_segs)
+
+    # Already a C-contiguous float64 (N, 2) array, passed to shapely as is
+    coords = rounded_rect_coords(xmin, ymin, xmax, ymax, r, arc_cos, arc_sin)
+    rounded = Polygon(coords)
+    if simplify_tol > 0:
+        rounded = rounded.simplify(simplify_tol, preserve_topology=False)
     return rounded
 
 
+def _subdivide(polygon, num_divisions):
+    """
+    Split `polygon` along an n x n grid of tiles covering its bounding box.
+
+    Args:
+        polygon (Polygon): Polygon to split.
+        num_divisions (int): Number of tiles along each axis.
+
+    Returns:
+        list: The non-empty Polygon pieces, row by row from the bottom left.
+    """
+    xmin, ymin, xmax, ymax = polygon.bounds
+    xs = np.linspace(xmin, xmax, num_divisions + 1)
+    ys = np.linspace(ymin, ymax, num_divisions + 1)
+
+    pieces = []
+    for y0, y1 in zip(ys[:-1], ys[1:]):
+        for x0, x1 in zip(xs[:-1], xs[1:]):
+            piece = polygon.intersection(_box(x0, y0, x1, y1))
+            # Tiles that only touch the rounded corners leave no area
+            if piece.geom_type == "Polygon" and not piece.is_empty:
+                pieces.append(piece)
+    return pieces
+
+
+def _placement_matrix(angle, pos_x, pos_y, xfact=1.0, yfact=1.0, xoff=0.0, yoff=0.0):
+    """
+    Affine matrix (a, b, d, e, xoff, yoff) in shapely affine_transform order.
+
+    Composes, in order: scale by (xfact, yfact) about the origin, translate by
+    (xoff, yoff), rotate by `angle` degrees about the origin and translate to
+    (pos_x, pos_y). This is the chain draw.scale -> draw.translate ->
+    draw.rotate_position collapsed into a single coordinate pass.
+    """
+    theta = np.deg2rad(angle)
+    cos, sin = np.cos(theta), np.sin(theta)
+    # Snap like shapely.affinity.rotate so 90-degree turns stay exact
+    if abs(cos) < 2.5e-16:
+        cos = 0.0
+    if abs(sin) < 2.5e-16:
+        sin = 0.0
+    return (
+        cos * xfact, -sin * yfact,
+        sin * xfact, cos * yfact,
+        cos * xoff - sin * yoff + pos_x,
+        sin * xoff + cos * yoff + pos_y,
+    )
+
+
+def _apply_placement(geometries, matrix):
+    """
+    Return `geometries` with the _placement_matrix `matrix` applied.
+
+    shapely.transform gathers the vertices of all the geometries into a single
+    (N, 2) array in C, so they are placed with one numpy matrix product rather
+    than one Python round-trip per geometry.
+    """
+    a, b, d, e, xoff, yoff = matrix
+    linear = np.array([[a, b], [d, e]])
+    offset = np.array([xoff, yoff])
+    return list(shapely.transform(geometries, lambda coords: coords @ linear.T + offset))
+
+
 class TransmonPocket6Rounded(BaseQubit):
     """Transmon pocket with 6 connection pads + optional rounded corners."""
 
@@ -90,6 +197,15 @@ class TransmonPocket6Rounded(BaseQubit):
         pocket_corner_radius=None,     # if None -> uses corner_radius
         connector_corner_radius=None,  # if None -> uses corner_radius
 
+        # corner arc resolution: segments per quarter circle, and tolerance
+        # used to drop arc vertices finer than the layout needs (0 -> keep all)
+        corner_quad_segs="16",
+        corner_simplify_tol="0.01um",
+
+        # split the pocket cutout into an n x n grid of tiles, so the
+        # subtraction from the ground plane works on smaller polygons
+        pocket_num_divisions="1",
+
         _default_connection_pads=Dict(
             pad_gap="15um",
             pad_width="125um",
@@ -115,32 +231,204 @@ class TransmonPocket6Rounded(BaseQubit):
 
     TOOLTIP = "Transmon pocket with 6 connection pads + rounded corners."
 
+    # Cache behind prepared_pocket; cleared whenever the pocket is re-added
+    _prepared_pocket = None
+
     def make(self):
-        self.make_pocket()
-        self.make_connection_pads()
+        # Radii are resolved once and shared by the pocket and every pad
+        radii = self._get_radii()
+        style = self._get_corner_style()
+        self.make_pocket(radii, style)
+        self.make_connection_pads(radii, style)
+
+    @classmethod
+    def build_array(cls, design, placements, options=None, name_prefix=None):
+        """Create copies of the qubit that differ only in their placement.
+
+        The geometry is built once, at the origin, from the shared options.
+        The stacked vertices of every copy are then placed with a single
+        numpy operation over an (N, M, 2) array, instead of running make()
+        for each qubit. Each copy stores its own pos_x, pos_y and orientation
+        options, as strings like any other option, so a later rebuild()
+        reproduces the same geometry.
+
+        The copies never run make(): their qgeometry is added directly and
+        they are then marked as made. A subclass that overrides make() is
+        therefore not supported, since its extra geometry would be missing.
+        Build status and build logs follow QComponent.rebuild: every copy is
+        'failed' until its geometry is added, and an error is logged and
+        re-raised.
+
+        Args:
+            design (QDesign): The parent design.
+            placements (array_like): (N, 3) rows of [pos_x, pos_y, orientation],
+                positions in design units and orientation in degrees.
+            options (dict): Options shared by all the copies.  Defaults to None.
+            name_prefix (str): Copies are named name_prefix + index. Auto-named
+                if None.  Defaults to None.
+
+        Returns:
+            list: The N new components.
+
+        Raises:
+            ValueError: If placements is not (N, 3).
+        """
+        placements = np.asarray(placements, dtype=float)
+        if placements.size == 0:
+            placements = placements.reshape(0, 3)
+        if placements.ndim != 2 or placements.shape[1] != 3:
+            raise ValueError("placements must be (N, 3) rows of [pos_x, pos_y, orientation], "
+                             f"got shape {placements.shape}")
+
+        qubits = []
+        for i, (pos_x, pos_y, orientation) in enumerate(placements):
+            qubit_options = Dict(deepcopy(options or {}))
+            # str(float) round-trips exactly through the option parser
+            qubit_options.update(pos_x=str(pos_x),
+                                 pos_y=str(pos_y),
+                                 orientation=str(orientation))
+            name = None if name_prefix is None else f"{name_prefix}{i}"
+            qubits.append(cls(design, name, options=qubit_options, make=False))
+        if not qubits:
+            return qubits
+
+        # As in QComponent.rebuild, every copy is 'failed' until it is built
+        for qubit in qubits:
+            qubit.status = "failed"
+
+        # Build once at the origin; the options other than placement are shared
+        # pylint: disable=protected-access
+        template = qubits[0]
+        try:
+            radii = template._get_radii()
+            style = template._get_corner_style()
+            origin = (0.0, 0.0, 0.0)
+            pocket = template._build_pocket(radii, style, placement=origin)
+            pad_names = list(template.options.connection_pads)
+            pads = [template._build_connection_pad(name, radii, style, placement=origin)
+                    for name in pad_names]
+        except Exception as error:
+            for qubit in qubits:
+                qubit._log_build_error(error)
+            raise error
+
+        # Pins are carried along as two-point lines
+        geometries = [pocket.pad_top, pocket.pad_bot, pocket.rect_pk, pocket.rect_jj]
+        for pad in pads:
+            geometries += [pad.connector_pad, pad.wire, LineString(pad.pin_points)]
+        geometries = np.array(geometries, dtype=object)
+        coords = shapely.get_coordinates(geometries)
+
+        matrices = np.array([
+            _placement_matrix(orientation, pos_x, pos_y)
+            for pos_x, pos_y, orientation in placements
+        ])
+        rotations = matrices[:, :4].reshape(-1, 2, 2)
+        placed = np.einsum("nij,mj->nmi", rotations, coords) + matrices[:, None, 4:]
+
+        for qubit, qubit_coords in zip(qubits, placed):
+            try:
+                # set_coordinates fills the array it is given, so hand it a copy
+                geoms = iter(shapely.set_coordinates(geometries.copy(), qubit_coords))
+                qubit._add_pocket(Dict(pocket,
+                                       pad_top=next(geoms),
+                                       pad_bot=next(geoms),
+                                       rect_pk=next(geoms),
+                                       rect_jj=next(geoms)))
+                for name, pad in zip(pad_names, pads):
+                    qubit._add_connection_pad(name, Dict(pad,
+                                                         connector_pad=next(geoms),
+                                                         wire=next(geoms),
+                                                         pin_points=np.asarray(next(geoms).coords)))
+                qubit._made = True
+                qubit.status = "good"
+
+                design.build_logs.add_success(
+                    f"{str(datetime.now())} -- Component: {qubit.name} successfully built")
+
+            except Exception as error:
+                qubit._log_build_error(error)
+                raise error
+
+        return qubits
+
+    def _log_build_error(self, error):
+        """Record a failed build the way QComponent.rebuild does.
+
+        Args:
+            error (Exception): The build error.
+        """
+        self.logger.error(f"ERROR in building component name={self.name}, error={error}")
+        self.design.build_logs.add_error(
+            f"{str(datetime.now())} -- Component: {self.name} failed with error\n: {error}")
 
     def _get_radii(self):
         """Resolve the three radii from options (parsed values)."""
         p = self.p
 
+        # Read each option once: every self.p access re-parses it
         base = float(p.corner_radius)
-        pad_r = base if p.pad_corner_radius is None else float(p.pad_corner_radius)
-        pk_r = base if p.pocket_corner_radius is None else float(p.pocket_corner_radius)
-        cn_r = base if p.connector_corner_radius is None else float(p.connector_corner_radius)
+        radii = (p.pad_corner_radius, p.pocket_corner_radius, p.connector_corner_radius)
+
+        return tuple(base if r is None else float(r) for r in radii)
 
-        return pad_r, pk_r, cn_r
+    def _get_corner_style(self):
+        """Resolve the corner arc resolution and simplification tolerance.
 
-    def make_pocket(self):
+        Returns:
+            dict: quad_segs and simplify_tol, as keyword arguments of
+            _rounded_rectangle.
+        """
+        p = self.p
+        return dict(quad_segs=int(p.corner_quad_segs),
+                    simplify_tol=float(p.corner_simplify_tol))
+
+    def make_pocket(self, radii=None, style=None):
+        """Make the islands, junction and pocket.
+
+        Args:
+            radii (tuple): (pad_r, pk_r, cn_r) as returned by _get_radii().
+                Resolved from the options if None.  Defaults to None.
+            style (dict): Corner style as returned by _get_corner_style().
+                Resolved from the options if None.  Defaults to None.
+        """
+        self._add_pocket(self._build_pocket(radii, style))
+
+    def _build_pocket(self, radii=None, style=None, placement=None):
+        """Build the geometry of the islands, junction and pocket.
+
+        Has no side effects on the design: the result is registered by
+        _add_pocket.
+
+        Args:
+            radii (tuple): (pad_r, pk_r, cn_r) as returned by _get_radii().
+                Resolved from the options if None.  Defaults to None.
+            style (dict): Corner style as returned by _get_corner_style().
+                Resolved from the options if None.  Defaults to None.
+            placement (tuple): (orientation, pos_x, pos_y) to place the
+                geometry at. Read from the options if None.  Defaults to None.
+
+        Returns:
+            Dict: pad_top, pad_bot, rect_pk (Polygon, or MultiPolygon when
+            subdivided), rect_jj (LineString), all placed, plus
+            inductor_width and num_divisions.
+        """
+        # Every self.p access re-parses the option, so read each one once
         p = self.p
-        pad_r, pk_r, _ = self._get_radii()
+        pad_r, pk_r, _ = radii or self._get_radii()
+        style = style or self._get_corner_style()
+        orientation, pos_x, pos_y = placement or (p.orientation, p.pos_x, p.pos_y)
 
         pad_width = p.pad_width
         pad_height = p.pad_height
         pad_gap = p.pad_gap
+        pocket_width = p.pocket_width
+        pocket_height = p.pocket_height
 
         # Island pads (rounded if requested)
         # draw.rectangle(w,h) returns a centered rect; we reproduce that with shapely:
-        pad = _rounded_rectangle(pad_width, pad_height, xoff=-pad_width / 2, yoff=+pad_height / 2, radius=pad_r)
+        pad = _rounded_rectangle(pad_width, pad_height, xoff=-pad_width / 2, yoff=+pad_height / 2,
+                                 radius=pad_r, **style)
         pad_top = draw.translate(pad, 0, +(pad_height + pad_gap) / 2.0)
         pad_bot = draw.translate(pad, 0, -(pad_height + pad_gap) / 2.0)
 
@@ -149,34 +437,138 @@ class TransmonPocket6Rounded(BaseQubit):
 
         # Pocket cutout (rounded if requested)
         rect_pk = _rounded_rectangle(
-            p.pocket_width, p.pocket_height,
-            xoff=-p.pocket_width / 2, yoff=+p.pocket_height / 2,
-            radius=pk_r
+            pocket_width, pocket_height,
+            xoff=-pocket_width / 2, yoff=+pocket_height / 2,
+            radius=pk_r, **style
         )
 
+        num_divisions = int(p.pocket_num_divisions)
+        if num_divisions > 1:
+            # add_qgeometry stores a MultiPolygon as rect_pk_0, rect_pk_1, ...
+            rect_pk = MultiPolygon(_subdivide(rect_pk, num_divisions))
+
+        matrix = _placement_matrix(orientation, pos_x, pos_y)
         polys = [rect_jj, pad_top, pad_bot, rect_pk]
-        polys = draw.rotate(polys, p.orientation, origin=(0, 0))
-        polys = draw.translate(polys, p.pos_x, p.pos_y)
+        polys = _apply_placement(polys, matrix)
         [rect_jj, pad_top, pad_bot, rect_pk] = polys
 
-        self.add_qgeometry("poly", dict(pad_top=pad_top, pad_bot=pad_bot))
-        self.add_qgeometry("poly", dict(rect_pk=rect_pk), subtract=True)
-        self.add_qgeometry("junction", dict(rect_jj=rect_jj), width=p.inductor_width)
-
-    def make_connection_pads(self):
-        for name in self.options.connection_pads:
-            self.make_connection_pad(name)
-
-    def make_connection_pad(self, name: str):
+        return Dict(pad_top=pad_top,
+                    pad_bot=pad_bot,
+                    rect_pk=rect_pk,
+                    rect_jj=rect_jj,
+                    inductor_width=p.inductor_width,
+                    num_divisions=num_divisions)
+
+    def _add_pocket(self, pocket: Dict):
+        """Add a pocket built by _build_pocket to the design.
+
+        Args:
+            pocket (Dict): Result of _build_pocket.
+        """
+        self.metadata.pocket_num_divisions = pocket.num_divisions
+
+        self.add_qgeometry("poly", dict(pad_top=pocket.pad_top, pad_bot=pocket.pad_bot))
+        self.add_qgeometry("poly", dict(rect_pk=pocket.rect_pk), subtract=True)
+        # The pocket changed, prepared_pocket must be rebuilt from the table
+        self._prepared_pocket = None
+        self.add_qgeometry("junction", dict(rect_jj=pocket.rect_jj), width=pocket.inductor_width)
+
+    @property
+    def prepared_pocket(self):
+        """The pocket cutout, prepared for fast intersection and containment
+        tests.
+
+        Built from the rect_pk qgeometry on first access (a union of the
+        pieces if the pocket is divided) and cached until the pocket is
+        rebuilt. The cache is not pickled with the component.
+
+        Returns:
+            shapely.geometry.base.BaseGeometry: The prepared pocket.
+        """
+        if self._prepared_pocket is None:
+            pieces = [geom for name, geom in self.qgeometry_dict("poly").items()
+                      if name.startswith("rect_pk")]
+            pocket = shapely.union_all(pieces)
+            shapely.prepare(pocket)
+            self._prepared_pocket = pocket
+        return self._prepared_pocket
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_prepared_pocket", None)
+        return state
+
+    def make_connection_pads(self, radii=None, style=None):
+        """Make all the connection pads.
+
+        Args:
+            radii (tuple): (pad_r, pk_r, cn_r) as returned by _get_radii().
+                Resolved from the options if None.  Defaults to None.
+            style (dict): Corner style as returned by _get_corner_style().
+                Resolved from the options if None.  Defaults to None.
+        """
+        radii = radii or self._get_radii()
+        style = style or self._get_corner_style()
+        # Build every pad first, then register them on the qgeometry tables
+        built = [(name, self._build_connection_pad(name, radii, style))
+                 for name in self.options.connection_pads]
+        for name, pad in built:
+            self._add_connection_pad(name, pad)
+
+    def make_connection_pad(self, name: str, radii=None, style=None):
+        """Make the named connection pad, its wire and its pin.
+
+        Args:
+            name (str): Name of the connection pad.
+            radii (tuple): (pad_r, pk_r, cn_r) as returned by _get_radii().
+                Resolved from the options if None.  Defaults to None.
+            style (dict): Corner style as returned by _get_corner_style().
+                Resolved from the options if None.  Defaults to None.
+        """
+        self._add_connection_pad(name, self._build_connection_pad(name, radii, style))
+
+    def _build_connection_pad(self, name: str, radii=None, style=None, placement=None):
+        """Build the geometry of the named connection pad.
+
+        Has no side effects on the design: the result is registered by
+        _add_connection_pad.
+
+        Args:
+            name (str): Name of the connection pad.
+            radii (tuple): (pad_r, pk_r, cn_r) as returned by _get_radii().
+                Resolved from the options if None.  Defaults to None.
+            style (dict): Corner style as returned by _get_corner_style().
+                Resolved from the options if None.  Defaults to None.
+            placement (tuple): (orientation, pos_x, pos_y) to place the
+                geometry at. Read from the options if None.  Defaults to None.
+
+        Returns:
+            Dict: connector_pad (Polygon), wire (LineString), pin_points
+            (np.ndarray), cpw_width and cpw_gap (float), all placed.
+        """
         p = self.p
         pc = self.p.connection_pads[name]
-        _, _, cn_r = self._get_radii()
-
+        _, _, cn_r = radii or self._get_radii()
+        style = style or self._get_corner_style()
+        orientation, pos_x, pos_y = placement or (p.orientation, p.pos_x, p.pos_y)
+
+        # Qubit-level options
+        island_width = p.pad_width
+        island_height = p.pad_height
+        island_gap = p.pad_gap
+        pocket_width = p.pocket_width
+        # Gap between the island edge and the pocket edge
+        half_pocket_minus_pad = (pocket_width - island_width) / 2.0
+
+        # Connection pad options
         cpw_width = pc.cpw_width
+        cpw_gap = pc.cpw_gap
         cpw_extend = pc.cpw_extend
         pad_width = pc.pad_width
         pad_height = pc.pad_height
+        pad_gap = pc.pad_gap
         pad_cpw_shift = pc.pad_cpw_shift
+        pad_cpw_extent = pc.pad_cpw_extent
         pocket_rise = pc.pocket_rise
         pocket_extent = pc.pocket_extent
 
@@ -193,23 +585,24 @@ class TransmonPocket6Rounded(BaseQubit):
             connector_pad = _rounded_rectangle(
                 pad_width, pad_height,
                 xoff=-pad_width / 2, yoff=+pad_height / 2,
-                radius=cn_r
+                radius=cn_r, **style
             )
 
-            connector_wire_path = draw.wkt.loads(
-                f"""LINESTRING (
-                    0 {pad_cpw_shift + cpw_width/2},
-                    {pc.pad_cpw_extent} {pad_cpw_shift + cpw_width/2},
-                    {(p.pocket_width - p.pad_width)/2 - pocket_extent} {pad_cpw_shift + cpw_width/2 + pocket_rise},
-                    {(p.pocket_width - p.pad_width)/2 + cpw_extend} {pad_cpw_shift + cpw_width/2 + pocket_rise}
-                )"""
+            wire_y = pad_cpw_shift + cpw_width / 2
+            connector_wire_path = draw.LineString(
+                [
+                    [0, wire_y],
+                    [pad_cpw_extent, wire_y],
+                    [half_pocket_minus_pad - pocket_extent, wire_y + pocket_rise],
+                    [half_pocket_minus_pad + cpw_extend, wire_y + pocket_rise],
+                ]
             )
         else:
             # Stock: draw.rectangle(pad_width, pad_height, 0, pad_height/2)
             connector_pad = _rounded_rectangle(
                 pad_width, pad_height,
                 xoff=0.0, yoff=+pad_height / 2,
-                radius=cn_r
+                radius=cn_r, **style
             )
 
             connector_wire_path = draw.LineString(
@@ -217,7 +610,7 @@ class TransmonPocket6Rounded(BaseQubit):
                     [0, pad_height],
                     [
                         0,
-                        (p.pocket_width / 2 - p.pad_height - p.pad_gap / 2 - pc.pad_gap) + cpw_extend,
+                        (pocket_width / 2 - island_height - island_gap / 2 - pad_gap) + cpw_extend,
                     ],
                 ]
             )
@@ -227,24 +620,40 @@ class TransmonPocket6Rounded(BaseQubit):
         # Keep stock scaling trick for loc_W=0
         loc_Woff = 1.0 if loc_W == 0 else loc_W
 
-        objects = draw.scale(objects, loc_Woff, loc_H, origin=(0, 0))
-        objects = draw.translate(
-            objects,
-            loc_W * (p.pad_width) / 2.0,
-            loc_H * (p.pad_height + p.pad_gap / 2 + pc.pad_gap),
+        # scale -> translate -> rotate_position, as a single transform
+        matrix = _placement_matrix(
+            orientation, pos_x, pos_y,
+            xfact=loc_Woff, yfact=loc_H,
+            xoff=loc_W * island_width / 2.0,
+            yoff=loc_H * (island_height + island_gap / 2 + pad_gap),
         )
-        objects = draw.rotate_position(objects, p.orientation, [p.pos_x, p.pos_y])
+        objects = _apply_placement(objects, matrix)
         connector_pad, connector_wire_path = objects
 
-        self.add_qgeometry("poly", {f"{name}_connector_pad": connector_pad})
-        self.add_qgeometry("path", {f"{name}_wire": connector_wire_path}, width=cpw_width)
+        # Pins (unchanged): only the last two vertices are needed
+        pin_points = np.asarray(connector_wire_path.coords[-2:])
+
+        return Dict(connector_pad=connector_pad,
+                    wire=connector_wire_path,
+                    pin_points=pin_points,
+                    cpw_width=cpw_width,
+                    cpw_gap=cpw_gap)
+
+    def _add_connection_pad(self, name: str, pad: Dict):
+        """Add a connection pad built by _build_connection_pad to the design.
+
+        Args:
+            name (str): Name of the connection pad.
+            pad (Dict): Result of _build_connection_pad.
+        """
+        cpw_width = pad.cpw_width
+
+        self.add_qgeometry("poly", {f"{name}_connector_pad": pad.connector_pad})
+        self.add_qgeometry("path", {f"{name}_wire": pad.wire}, width=cpw_width)
         self.add_qgeometry(
             "path",
-            {f"{name}_wire_sub": connector_wire_path},
-            width=cpw_width + 2 * pc.cpw_gap,
+            {f"{name}_wire_sub": pad.wire},
+            width=cpw_width + 2 * pad.cpw_gap,
             subtract=True,
         )
-
-        # Pins (unchanged)
-        points = np.array(connector_wire_path.coords)
-        self.add_pin(name, points=points[-2:], width=cpw_width, input_as_norm=True)
+        self.add_pin(name, points=pad.pin_points, width=cpw_width, input_as_norm=True)
@@ -8,8 +8,8 @@ Adds half circles with smooth filleted connection close to the junction.
 
 How rounding works:
 - If corner_radius == 0 -> identical geometry to the stock component
-- If corner_radius > 0 -> rectangles are converted to rounded polygons via
-  erosion+dilation buffering (keeps outer dimensions approximately unchanged)
+- If corner_radius > 0 -> rectangles are converted to rounded polygons by
+  buffering an inset rectangle (keeps outer dimensions unchanged)
 """
 
 import numpy as np
@@ -42,9 +42,14 @@ def _rounded_rectangle(width, height, xoff=0.0, yoff=0.0, radius=0.0):
 
     Notes
     -----
-    We create the rectangle as a box, then apply:
+    We create the rectangle inset by r on every side, then apply:
+        inner.buffer(r, join_style=1)
+    On a rectangle this gives the same result as the erosion+dilation
         rect.buffer(-r, join_style=2).buffer(r, join_style=1)
-    This rounds the corners while keeping the *outer* size ~constant.
+    with a single offset pass, and keeps the *outer* size constant. At the
+    clamp, r = min(width,height)/2, the inset rectangle is a segment or a
+    point, so the result is a stadium or a disc; the erosion+dilation chain
+    returned an empty polygon there.
     """
     w = float(width)
     h = float(height)
@@ -64,10 +69,10 @@ def _rounded_rectangle(width, height, xoff=0.0, yoff=0.0, radius=0.0):
     xmax = xmin + w
     ymax = float(yoff)
     ymin = ymax - h
-    rect = _box(xmin, ymin, xmax, ymax)
+    inner = _box(xmin + r, ymin + r, xmax - r, ymax - r)
 
-    # Erode then dilate to round without changing outer bbox too much
-    rounded = rect.buffer(-r, join_style=2).buffer(r, join_style=1)
+    # Dilate the inset rectangle back to the outer bbox with round joins
+    rounded = inner.buffer(r, join_style=1, quad_segs=16)
     return rounded
 
 
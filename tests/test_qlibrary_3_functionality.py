@@ -18,8 +18,10 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests components functionality."""
 
+import pickle
 import unittest
 import numpy as np
+import shapely
 
 from qiskit_metal.qlibrary.core import _parsed_dynamic_attrs
 from qiskit_metal import Dict
@@ -48,6 +50,8 @@ from qiskit_metal.qlibrary.qubits import transmon_pocket
 from qiskit_metal.qlibrary.qubits import transmon_cross
 from qiskit_metal.qlibrary.qubits import transmon_cross_fl
 from qiskit_metal.qlibrary.qubits import transmon_pocket_6
+from qiskit_metal.qlibrary.qubits import transmon_pocket_6_rounded
+from qiskit_metal.qlibrary.qubits import transmon_pocket_H_6
 from qiskit_metal.qlibrary.qubits.transmon_pocket_teeth import TransmonPocketTeeth
 from qiskit_metal.qlibrary.qubits.SQUID_loop import SQUID_LOOP
 from qiskit_metal.qlibrary.couplers import tunable_coupler_01
@@ -548,6 +552,283 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
             anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
                                        np.array([5, 5]), np.array([7, 7])))
 
+    def test_qlibrary_transmon_pocket_6_rounded_rectangle(self):
+        """Test _rounded_rectangle in transmon_pocket_6_rounded.py."""
+        rounded_rectangle = transmon_pocket_6_rounded._rounded_rectangle
+
+        # Same polygon as the erosion+dilation buffer chain it replaces
+        for width, height, xoff, yoff, radius in [(0.455, 0.09, -0.2275, 0.045, 0.01),
+                                                  (0.125, 0.03, 0.0, 0.015, 0.005),
+                                                  (0.65, 0.65, -0.325, 0.325, 0.1)]:
+            rect = draw.box(xoff, yoff - height, xoff + width, yoff)
+            expected = rect.buffer(-radius, join_style=2).buffer(radius,
+                                                                 join_style=1)
+            actual = rounded_rectangle(width, height, xoff, yoff, radius)
+            self.assertTrue(actual.normalize().equals_exact(
+                expected.normalize(), 1e-12))
+
+        # Without a radius, the same rectangle as draw.rectangle
+        actual = rounded_rectangle(0.455, 0.09, -0.2275, 0.045)
+        self.assertTrue(actual.equals(draw.rectangle(0.455, 0.09)))
+
+        # A radius clamped to half the shorter side gives a stadium
+        # (the buffer chain collapsed to an empty polygon)
+        actual = rounded_rectangle(0.125, 0.03, 0.0, 0.015, 1.0)
+        self.assertFalse(actual.is_empty)
+        self.assertTrue(actual.is_valid)
+        self.assertEqual(actual.bounds, (0.0, -0.015, 0.125, 0.015))
+        self.assertAlmostEqualRel(0.095 * 0.03 + np.pi * 0.015**2,
+                                  actual.area,
+                                  rel_tol=1e-3)
+
+    def test_qlibrary_transmon_pocket_h_6_rounded_rectangle(self):
+        """Test _rounded_rectangle in transmon_pocket_H_6.py."""
+        rounded_rectangle = transmon_pocket_H_6._rounded_rectangle
+
+        # Same polygon as the erosion+dilation buffer chain it replaces
+        for width, height, xoff, yoff, radius in [(0.455, 0.09, -0.2275, 0.045, 0.01),
+                                                  (0.125, 0.03, 0.0, 0.015, 0.005),
+                                                  (0.65, 0.65, -0.325, 0.325, 0.1)]:
+            rect = draw.box(xoff, yoff - height, xoff + width, yoff)
+            expected = rect.buffer(-radius, join_style=2).buffer(radius,
+                                                                 join_style=1)
+            actual = rounded_rectangle(width, height, xoff, yoff, radius)
+            self.assertTrue(actual.normalize().equals_exact(
+                expected.normalize(), 1e-12))
+
+        # Without a radius, the same rectangle as draw.rectangle
+        actual = rounded_rectangle(0.455, 0.09, -0.2275, 0.045)
+        self.assertTrue(actual.equals(draw.rectangle(0.455, 0.09)))
+
+        # A radius clamped to half the shorter side gives a stadium, or a
+        # disc for a square (the buffer chain collapsed to an empty polygon)
+        actual = rounded_rectangle(0.125, 0.03, 0.0, 0.015, 1.0)
+        self.assertFalse(actual.is_empty)
+        self.assertTrue(actual.is_valid)
+        for expected, tested in zip((0.0, -0.015, 0.125, 0.015),
+                                    actual.bounds):
+            self.assertAlmostEqual(expected, tested)
+        self.assertAlmostEqualRel(0.095 * 0.03 + np.pi * 0.015**2,
+                                  actual.area,
+                                  rel_tol=1e-3)
+
+        actual = rounded_rectangle(0.1, 0.1, -0.05, 0.05, 1.0)
+        self.assertTrue(actual.is_valid)
+        for expected, tested in zip((-0.05, -0.05, 0.05, 0.05),
+                                    actual.bounds):
+            self.assertAlmostEqual(expected, tested)
+        self.assertAlmostEqualRel(np.pi * 0.05**2, actual.area, rel_tol=1e-2)
+
+    def test_qlibrary_transmon_pocket_6_rounded_placement(self):
+        """Test _placement_matrix and _apply_placement in
+        transmon_pocket_6_rounded.py."""
+        placement_matrix = transmon_pocket_6_rounded._placement_matrix
+        apply_placement = transmon_pocket_6_rounded._apply_placement
+
+        # Neither shape is symmetric, so a flipped axis or sign shows up
+        objects = [
+            draw.Polygon([(0, 0), (0.3, 0), (0.3, 0.1), (0.1, 0.1), (0.1, 0.2),
+                          (0, 0.2)]),
+            draw.LineString([(0, 0), (0.05, 0.15), (0.2, 0.25)])
+        ]
+        pos_x, pos_y = 1.2, -0.7
+
+        for orientation in [0, 33.3, 90, 270]:
+            # Pocket: rotate about the origin, then translate
+            expected = draw.translate(
+                draw.rotate(objects, orientation, origin=(0, 0)), pos_x, pos_y)
+            actual = apply_placement(
+                objects, placement_matrix(orientation, pos_x, pos_y))
+            for actual_geom, expected_geom in zip(actual, expected):
+                self.assertTrue(actual_geom.equals_exact(expected_geom, 1e-12))
+
+            # Connection pads: scale, translate, then rotate_position
+            for loc_W in [-1, 0, +1]:
+                loc_H = -1
+                loc_Woff = 1.0 if loc_W == 0 else loc_W
+                xoff, yoff = loc_W * 0.455 / 2.0, loc_H * 0.14
+                expected = draw.scale(objects, loc_Woff, loc_H, origin=(0, 0))
+                expected = draw.translate(expected, xoff, yoff)
+                expected = draw.rotate_position(expected, orientation,
+                                                [pos_x, pos_y])
+                actual = apply_placement(
+                    objects,
+                    placement_matrix(orientation,
+                                     pos_x,
+                                     pos_y,
+                                     xfact=loc_Woff,
+                                     yfact=loc_H,
+                                     xoff=xoff,
+                                     yoff=yoff))
+                for actual_geom, expected_geom in zip(actual, expected):
+                    self.assertTrue(
+                        actual_geom.equals_exact(expected_geom, 1e-12))
+
+    def test_qlibrary_transmon_pocket_6_rounded_num_divisions(self):
+        """Test pocket_num_divisions in transmon_pocket_6_rounded.py."""
+        design = designs.DesignPlanar()
+        whole = transmon_pocket_6_rounded.TransmonPocket6Rounded(design, 'Q1')
+        divided = transmon_pocket_6_rounded.TransmonPocket6Rounded(
+            design, 'Q2', options=dict(pocket_num_divisions='3'))
+
+        poly = design.qgeometry.tables['poly']
+        whole_pk = poly[(poly['component'] == whole.id) &
+                        (poly['name'] == 'rect_pk')]
+        divided_pk = poly[(poly['component'] == divided.id) &
+                          (poly['name'].str.startswith('rect_pk'))]
+
+        self.assertEqual(len(whole_pk), 1)
+        self.assertEqual(len(divided_pk), 9)
+        self.assertTrue(divided_pk['subtract'].all())
+        self.assertAlmostEqualRel(whole_pk.geometry.iloc[0].area,
+                                  divided_pk.geometry.union_all().area,
+                                  rel_tol=1e-9)
+        self.assertEqual(whole.metadata.pocket_num_divisions, 1)
+        self.assertEqual(divided.metadata.pocket_num_divisions, 3)
+
+    def test_qlibrary_transmon_pocket_6_rounded_corner_simplify_tol(self):
+        """Test corner_simplify_tol in transmon_pocket_6_rounded.py."""
+        design = designs.DesignPlanar()
+        simplified = transmon_pocket_6_rounded.TransmonPocket6Rounded(
+            design, 'Q1', options=dict(corner_radius='2um'))
+        full = transmon_pocket_6_rounded.TransmonPocket6Rounded(
+            design,
+            'Q2',
+            options=dict(corner_radius='2um', corner_simplify_tol='0'))
+
+        self.assertEqual(simplified.options.corner_simplify_tol, '0.01um')
+
+        poly = design.qgeometry.tables['poly']
+        for name in ['pad_top', 'pad_bot', 'rect_pk']:
+            simplified_geom = poly[(poly['component'] == simplified.id) &
+                                   (poly['name'] == name)].geometry.iloc[0]
+            full_geom = poly[(poly['component'] == full.id) &
+                             (poly['name'] == name)].geometry.iloc[0]
+
+            # 0 keeps every vertex of the 16 segment per quadrant outline
+            self.assertEqual(len(full_geom.exterior.coords), 69)
+            # The default drops vertices but keeps the outline
+            self.assertLess(len(simplified_geom.exterior.coords), 69)
+            self.assertGreater(len(simplified_geom.exterior.coords), 5)
+            self.assertAlmostEqualRel(full_geom.area,
+                                      simplified_geom.area,
+                                      rel_tol=1e-4)
+
+    def test_qlibrary_transmon_pocket_6_rounded_build_array(self):
+        """Test build_array in transmon_pocket_6_rounded.py."""
+        qubit_class = transmon_pocket_6_rounded.TransmonPocket6Rounded
+        options = dict(corner_radius='10um',
+                       pocket_num_divisions='2',
+                       connection_pads=dict(
+                           a=dict(loc_W=+1, loc_H=+1),
+                           b=dict(loc_W=-1, loc_H=-1, pocket_rise='10um'),
+                           c=dict(loc_W=0, loc_H=+1)))
+        placements = [(0, 0, 0), (1.5, -2.0, 90), (3.0, 1.0, 33.3)]
+
+        design = designs.DesignPlanar()
+        self.assertEqual(qubit_class.build_array(design, []), [])
+        for bad_placements in [[(0, 0), (1, 1), (2, 2)], [0, 0, 0],
+                               [(0, 0, 0, 0)]]:
+            with self.assertRaises(ValueError):
+                qubit_class.build_array(design, bad_placements)
+        self.assertEqual(len(design.components), 0)
+        qubits = qubit_class.build_array(design,
+                                         placements,
+                                         options=options,
+                                         name_prefix='Q')
+
+        expected_design = designs.DesignPlanar()
+        for i, (pos_x, pos_y, orientation) in enumerate(placements):
+            qubit_class(expected_design,
+                        f'Q{i}',
+                        options=dict(options,
+                                     pos_x=str(pos_x),
+                                     pos_y=str(pos_y),
+                                     orientation=str(orientation)))
+
+        self.assertEqual([qubit.name for qubit in qubits], ['Q0', 'Q1', 'Q2'])
+        self.assertEqual(qubits[1].options.pos_x, '1.5')
+        self.assertEqual(qubits[1].options.orientation, '90.0')
+
+        def assert_same_design(actual_design):
+            for kind in ['poly', 'path', 'junction']:
+                actual = actual_design.qgeometry.tables[kind].sort_values(
+                    ['component', 'name']).reset_index(drop=True)
+                expected = expected_design.qgeometry.tables[kind].sort_values(
+                    ['component', 'name']).reset_index(drop=True)
+                self.assertEqual(len(actual), len(expected))
+                self.assertEqual(list(actual['name']), list(expected['name']))
+                for actual_geom, expected_geom in zip(actual.geometry,
+                                                      expected.geometry):
+                    self.assertTrue(
+                        actual_geom.equals_exact(expected_geom, 1e-9))
+
+            for qubit in qubits:
+                expected_qubit = expected_design.components[qubit.name]
+                self.assertEqual(qubit.status, 'good')
+                self.assertEqual(list(qubit.pins), list(expected_qubit.pins))
+                for pin_name, pin in expected_qubit.pins.items():
+                    for field in ['points', 'middle', 'normal', 'tangent']:
+                        self.assertTrue(
+                            np.allclose(qubit.pins[pin_name][field],
+                                        pin[field]))
+
+        assert_same_design(design)
+        self.assertTrue(design.build_logs.data()[0].endswith(
+            'Component: Q2 successfully built'))
+
+        # A copy rebuilds from its own options to the same geometry
+        qubits[2].rebuild()
+        assert_same_design(design)
+
+        # A failed build is logged and leaves every copy 'failed'
+        with self.assertRaises(ValueError):
+            qubit_class.build_array(design, [(5, 5, 0), (6, 6, 0)],
+                                    options=dict(corner_quad_segs='many'),
+                                    name_prefix='F')
+        self.assertEqual(design.components['F0'].status, 'failed')
+        self.assertEqual(design.components['F1'].status, 'failed')
+        self.assertTrue(design.build_logs.data()[0].startswith('ERROR '))
+
+    def test_qlibrary_transmon_pocket_6_rounded_prepared_pocket(self):
+        """Test prepared_pocket in transmon_pocket_6_rounded.py."""
+        design = designs.DesignPlanar()
+        qubit = transmon_pocket_6_rounded.TransmonPocket6Rounded(
+            design, 'Q1', options=dict(pocket_num_divisions='3'))
+
+        prepared = qubit.prepared_pocket
+        self.assertTrue(shapely.is_prepared(prepared))
+        self.assertEqual(prepared.bounds, (-0.325, -0.325, 0.325, 0.325))
+        self.assertTrue(prepared.contains(shapely.Point(0.1, 0.1)))
+        self.assertIs(qubit.prepared_pocket, prepared)
+
+        # The cache follows a rebuild
+        qubit.options.pos_x = '1mm'
+        qubit.rebuild()
+        self.assertEqual(qubit.prepared_pocket.bounds,
+                         (0.675, -0.325, 1.325, 0.325))
+
+        # The cache is left out of the pickled state
+        state = qubit.__getstate__()
+        self.assertNotIn('_prepared_pocket', state)
+
+        # Whether the parent design pickles depends on its renderers, so only
+        # the component's own state makes the round-trip
+        state = {
+            key: value
+            for key, value in state.items()
+            if key not in ('_design', 'p')
+        }
+        restored = transmon_pocket_6_rounded.TransmonPocket6Rounded.__new__(
+            transmon_pocket_6_rounded.TransmonPocket6Rounded)
+        restored.__dict__.update(pickle.loads(pickle.dumps(state)))
+        restored._design = design
+
+        # and the property prepares the pocket again
+        self.assertTrue(shapely.is_prepared(restored.prepared_pocket))
+        self.assertEqual(restored.prepared_pocket.bounds,
+                         (0.675, -0.325, 1.325, 0.325))
+
     @staticmethod
     def generate_spiral_list(x: int, y: int):
         """Helper function to generate a sprital list.